@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["pymupdf"]
+# dependencies = ["pymupdf", "rapidfuzz", "orjson", "requests"]
 # ///
 """
 Check the papers.json database for issues:
@@ -12,86 +12,196 @@ Check the papers.json database for issues:
 Run with: uv run scripts/check_db.py [options]
 """
 
+import io
 import json
+import random
 import re
+import sqlite3
+import sys
+import threading
 import urllib.request
 import urllib.parse
 import time
 import hashlib
+import zlib
 from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta
 
+try:
+    from rapidfuzz import fuzz, process  # C++ implementation, much faster than difflib
+except ImportError:
+    fuzz = process = None
+
+try:
+    import orjson  # Faster JSON parsing/serialization, falls back to json
+except ImportError:
+    orjson = None
+
+try:
+    import requests  # Pooled keep-alive connections, falls back to urllib
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
 
 # Cache configuration
 CACHE_DIR = Path(__file__).parent / '.cache'
 PDF_CACHE_DIR = Path(__file__).parent / '.cache' / 'pdfs'
 CACHE_EXPIRY_HOURS = 24 * 7  # Cache expires after 7 days
 PDF_CACHE_EXPIRY_HOURS = 24 * 30  # PDF cache expires after 30 days
+DBLP_WORKERS = 8  # Concurrent DBLP requests; the rate limit still applies globally
+CACHE_DB_PATH = CACHE_DIR / 'cache.db'
+TITLE_INDEX_PATH = CACHE_DIR / 'title_index.json'
+TITLE_INDEX_VERSION = 1  # Bump when normalize_title or the MinHash scheme changes
+DBLP_VERDICT_VERSION = 1  # Bump when evaluate_dblp_results or find_best_dblp_match changes
+# Cached DBLP hits store their normalized title under a key tied to normalize_title's version
+DBLP_NORM_TITLE_KEY = f'_norm_title_v{TITLE_INDEX_VERSION}'
+
+# Duplicate detection prefilter (MinHash + LSH banding over title shingles)
+SHINGLE_SIZE = 3
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 32  # 2 rows per band: favours recall, SequenceMatcher confirms
+MINHASH_MASKS = [zlib.crc32(f"minhash-{i}".encode()) for i in range(MINHASH_PERMUTATIONS)]
+
+# Title normalization patterns
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+_DISAMBIGUATION_RE = re.compile(r'\s+\d{4}$')
+# Every ASCII character _PUNCT_RE would remove, for str.translate
+_ASCII_PUNCT_TABLE = dict.fromkeys(i for i in range(128) if _PUNCT_RE.match(chr(i)))
+
+
+def loads_json(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj):
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """Get the shared requests session, which reuses connections across API queries."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            adapter = HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+            )
+            _http_session = requests.Session()
+            _http_session.mount('https://', adapter)
+            _http_session.mount('http://', adapter)
+        return _http_session
+
+
+def http_get(url, headers, timeout):
+    """Fetch a URL and return the response body, raising on HTTP errors."""
+    if requests is not None:
+        response = get_http_session().get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        return response.read()
 
 
-def get_cache_path(url):
-    """Get cache file path for a URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    return CACHE_DIR / f"{url_hash}.json"
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def get_cache_key(url):
+    """Get the cache key for a URL (memoized, as each lookup may need it more than once)."""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def get_cache_db():
+    """Get the shared connection to the response cache database, creating it if needed.
+
+    The connection is shared between threads; callers must hold _cache_lock.
+    """
+    global _cache_conn
+    if _cache_conn is None:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _cache_conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        _cache_conn.execute("PRAGMA journal_mode=WAL")
+        _cache_conn.execute("PRAGMA synchronous=NORMAL")
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (url_hash TEXT PRIMARY KEY, url TEXT, ts REAL, data BLOB)"
+        )
+    return _cache_conn
 
 
 def load_from_cache(url):
     """Load cached response for a URL if it exists and isn't expired."""
-    cache_path = get_cache_path(url)
-    if not cache_path.exists():
+    min_ts = time.time() - CACHE_EXPIRY_HOURS * 3600
+    with _cache_lock:
+        row = get_cache_db().execute(
+            "SELECT data FROM cache WHERE url_hash = ? AND ts > ?", (get_cache_key(url), min_ts)
+        ).fetchone()
+    if row is None:
         return None
 
     try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            cached = json.load(f)
-
-        # Check expiry
-        cached_time = datetime.fromisoformat(cached['timestamp'])
-        if datetime.now() - cached_time > timedelta(hours=CACHE_EXPIRY_HOURS):
-            return None
-
-        return cached['data']
-    except (json.JSONDecodeError, KeyError, ValueError):
+        return loads_json(row[0])
+    except json.JSONDecodeError:
         return None
 
 
 def save_to_cache(url, data):
     """Save response data to cache."""
-    CACHE_DIR.mkdir(exist_ok=True)
-    cache_path = get_cache_path(url)
-
-    cached = {
-        'timestamp': datetime.now().isoformat(),
-        'url': url,
-        'data': data
-    }
-
-    with open(cache_path, 'w', encoding='utf-8') as f:
-        json.dump(cached, f, ensure_ascii=False)
+    blob = dumps_json(data)
+    with _cache_lock:
+        conn = get_cache_db()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (url_hash, url, ts, data) VALUES (?, ?, ?, ?)",
+                (get_cache_key(url), url, time.time(), blob)
+            )
 
 
 def clear_cache():
     """Clear all cached responses."""
-    if CACHE_DIR.exists():
-        count = 0
-        for cache_file in CACHE_DIR.glob('*.json'):
-            cache_file.unlink()
-            count += 1
-        return count
-    return 0
+    if not CACHE_DIR.exists():
+        return 0
+
+    with _cache_lock:
+        conn = get_cache_db()
+        with conn:
+            count = conn.execute("DELETE FROM cache").rowcount
+
+    # Also drop JSON cache files (title index, responses from older versions)
+    for cache_file in CACHE_DIR.glob('*.json'):
+        cache_file.unlink()
+        count += 1
+    return count
 
 
 def get_pdf_cache_path(url):
     """Get cache file path for a PDF URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    return PDF_CACHE_DIR / f"{url_hash}.pdf"
+    return PDF_CACHE_DIR / f"{get_cache_key(url)}.pdf"
 
 
 def get_pdf_meta_path(url):
     """Get metadata file path for a cached PDF."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    return PDF_CACHE_DIR / f"{url_hash}.meta.json"
+    return PDF_CACHE_DIR / f"{get_cache_key(url)}.meta.json"
 
 
 def is_pdf_cached(url):
@@ -336,8 +446,8 @@ def normalize_for_comparison(text):
     """Normalize text for fuzzy comparison."""
     # Lowercase, remove punctuation, collapse whitespace
     t = text.lower()
-    t = re.sub(r'[^\w\s]', ' ', t)
-    t = re.sub(r'\s+', ' ', t).strip()
+    t = _PUNCT_RE.sub(' ', t)
+    t = _WS_RE.sub(' ', t).strip()
     return t
 
 
@@ -389,12 +499,16 @@ def clear_pdf_cache():
     return 0
 
 
-def is_dblp_cached(title, max_results=5):
-    """Check if a DBLP query is cached."""
+def get_dblp_query_url(title, max_results=5):
+    """Get the DBLP search API URL for a paper title."""
     base_url = "https://dblp.org/search/publ/api"
     params = {'q': title, 'format': 'json', 'h': max_results}
-    url = f"{base_url}?{urllib.parse.urlencode(params)}"
-    return load_from_cache(url) is not None
+    return f"{base_url}?{urllib.parse.urlencode(params)}"
+
+
+def is_dblp_cached(title, max_results=5):
+    """Check if a DBLP query is cached."""
+    return load_from_cache(get_dblp_query_url(title, max_results)) is not None
 
 
 def get_json_path():
@@ -404,40 +518,95 @@ def get_json_path():
 
 def load_data():
     """Load data from JSON file."""
-    with open(get_json_path(), 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # The parser decodes the UTF-8 bytes itself, no text-mode wrapper needed
+    return loads_json(get_json_path().read_bytes())
 
 
 def save_data(data):
     """Save data to JSON file."""
-    with open(get_json_path(), 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
+    content = json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+    # Write next to the target and swap it in, so a crash never leaves a truncated file
+    json_path = get_json_path()
+    tmp_path = json_path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(content.encode('utf-8'))
+    tmp_path.replace(json_path)
 
 
 def load_papers():
-    """Load papers from JSON file."""
-    return load_data()['papers']
+    """Load papers from JSON file for read-only use.
+
+    Use load_data() instead when the data will be written back with save_data().
+    """
+    try:
+        import ijson  # Optional - streams the papers array instead of the whole document
+    except ImportError:
+        papers = load_data()['papers']
+    else:
+        with open(get_json_path(), 'rb') as f:
+            papers = list(ijson.items(f, 'papers.item'))
+    return papers
 
 
 def normalize_title(title):
     """Normalize title for comparison."""
-    # Convert to lowercase
-    t = title.lower()
-    # Remove punctuation and extra whitespace
-    t = re.sub(r'[^\w\s]', '', t)
-    t = re.sub(r'\s+', ' ', t).strip()
-    return t
+    # Lowercase and drop ASCII punctuation in a single translate pass
+    t = title.lower().translate(_ASCII_PUNCT_TABLE)
+    # Non-ASCII titles may still contain Unicode punctuation
+    if not t.isascii():
+        t = _PUNCT_RE.sub('', t)
+    # Collapse whitespace
+    return ' '.join(t.split())
+
+
+def author_name(author):
+    """Get an author's name from either an author object or a plain name string."""
+    return author.get('name', '') if isinstance(author, dict) else str(author)
 
 
 def strip_dblp_disambiguation(name):
     """Strip DBLP disambiguation numbers from author names (e.g., 'Wenbo Guo 0002' -> 'Wenbo Guo')."""
-    return re.sub(r'\s+\d{4}$', '', name)
+    return _DISAMBIGUATION_RE.sub('', name)
+
+
+def fuzzy_matcher(s2):
+    """Build a similarity function against a fixed second string.
+
+    The returned function takes (s1, cutoff=0.0) and reuses difflib's index of
+    s2 across calls, so scoring many strings against one is cheaper.
+    """
+    if fuzz is not None:
+        return lambda s1, cutoff=0.0: fuzz.ratio(s1, s2, score_cutoff=cutoff * 100) / 100.0
+
+    sm = SequenceMatcher(None, b=s2)
+
+    def similarity(s1, cutoff=0.0):
+        if s1 == s2:
+            return 1.0
+        sm.set_seq1(s1)
+        # Cheap upper bounds first; ratio() is only needed if both can reach cutoff
+        if cutoff and (sm.real_quick_ratio() < cutoff or sm.quick_ratio() < cutoff):
+            return 0.0
+        return sm.ratio()
+
+    return similarity
+
+
+def fuzzy_similarity(s1, s2, cutoff=0.0):
+    """Calculate fuzzy similarity between two strings.
 
+    Scores below cutoff may be reported as 0.0, which lets the scorer bail out early.
+    """
+    return fuzzy_matcher(s2)(s1, cutoff)
 
-def fuzzy_similarity(s1, s2):
-    """Calculate fuzzy similarity between two strings."""
-    return SequenceMatcher(None, s1, s2).ratio()
+
+def set_bits(mask):
+    """List the positions of the set bits in an integer, lowest first."""
+    bits = []
+    while mask:
+        lsb = mask & -mask
+        bits.append(lsb.bit_length() - 1)
+        mask ^= lsb
+    return bits
 
 
 def check_missing_years(papers):
@@ -446,136 +615,263 @@ def check_missing_years(papers):
     print("CHECKING FOR MISSING YEARS")
     print("=" * 60)
 
-    venues = {}
+    # Single pass: per venue, a bitmask of covered years plus the year range
+    coverage = {}
     for p in papers:
-        venue = p['venue']
         year = p['year']
-        if venue not in venues:
-            venues[venue] = set()
-        venues[venue].add(year)
+        entry = coverage.get(p['venue'])
+        if entry is None:
+            coverage[p['venue']] = [1 << year, year, year]
+        else:
+            entry[0] |= 1 << year
+            if year < entry[1]:
+                entry[1] = year
+            elif year > entry[2]:
+                entry[2] = year
 
     issues_found = False
-    for venue, years in sorted(venues.items()):
-        min_year = min(years)
-        max_year = max(years)
-        expected = set(range(min_year, max_year + 1))
-        missing = expected - years
+    for venue, (mask, min_year, max_year) in sorted(coverage.items()):
+        expected = ((1 << (max_year - min_year + 1)) - 1) << min_year
+        years = set_bits(mask)
+        missing = set_bits(mask ^ expected)
 
         print(f"\n{venue}:")
         print(f"  Coverage: {min_year} - {max_year}")
-        print(f"  Years with data: {sorted(years)}")
+        print(f"  Years with data: {years}")
 
         if missing:
             issues_found = True
-            print(f"  MISSING YEARS: {sorted(missing)}")
+            print(f"  MISSING YEARS: {missing}")
         else:
             print(f"  No gaps found")
 
     return issues_found
 
 
-def check_duplicates(papers, threshold=0.85):
+def title_shingles(norm_title):
+    """Get the set of character shingles of a normalized title."""
+    if len(norm_title) <= SHINGLE_SIZE:
+        return {norm_title}
+    return {norm_title[i:i + SHINGLE_SIZE] for i in range(len(norm_title) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(norm_title):
+    """Compute a MinHash signature over the character shingles of a title."""
+    hashes = [zlib.crc32(s.encode()) for s in title_shingles(norm_title)]
+    return [min(h ^ mask for h in hashes) for mask in MINHASH_MASKS]
+
+
+def lsh_candidate_pairs(signatures):
+    """Find index pairs whose MinHash signatures collide in at least one LSH band."""
+    rows = MINHASH_PERMUTATIONS // LSH_BANDS
+    buckets = {}
+    candidates = set()
+    for idx, sig in enumerate(signatures):
+        for band in range(LSH_BANDS):
+            key = (band, tuple(sig[band * rows:(band + 1) * rows]))
+            bucket = buckets.setdefault(key, [])
+            for other in bucket:
+                candidates.add((other, idx))
+            bucket.append(idx)
+    # Order by the second index so pairs sharing it are adjacent
+    return sorted(candidates, key=lambda pair: (pair[1], pair[0]))
+
+
+def title_index_params():
+    """Get the parameters a cached title index must have been built with."""
+    return [TITLE_INDEX_VERSION, SHINGLE_SIZE, MINHASH_MASKS]
+
+
+def build_title_index(papers, use_cache=True):
+    """Get [normalized title, MinHash signature] for every paper, reusing cached entries."""
+    cached = {}
+    if use_cache:
+        try:
+            with open(TITLE_INDEX_PATH, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored['params'] == title_index_params():
+                cached = stored['titles']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+    titles = {}
+    index = []
+    for p in papers:
+        entry = titles.get(p['title']) or cached.get(p['title'])
+        if entry is None:
+            norm = normalize_title(p['title'])
+            entry = [norm, minhash_signature(norm)]
+        titles[p['title']] = entry
+        index.append(entry)
+
+    # Rewrite the cache only when titles were added or removed
+    if use_cache and titles.keys() != cached.keys():
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(TITLE_INDEX_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'params': title_index_params(), 'titles': titles}, f, ensure_ascii=False)
+
+    return index
+
+
+def scan_venue_duplicates(group, threshold):
+    """Find likely duplicates among (index, paper, normalized title, signature) entries of one venue."""
+    duplicates = []
+
+    def add_duplicate(entry1, entry2, similarity):
+        if entry1[0] > entry2[0]:
+            entry1, entry2 = entry2, entry1
+        duplicates.append({
+            'similarity': similarity,
+            'paper1': entry1[1],
+            'paper2': entry2[1],
+            'idx1': entry1[0],
+            'idx2': entry2[0]
+        })
+
+    # Identical normalized titles are duplicates without any fuzzy matching
+    clusters = {}
+    for entry in group:
+        clusters.setdefault(entry[2], []).append(entry)
+    clusters = list(clusters.values())
+    for entries in clusters:
+        for i, entry1 in enumerate(entries):
+            for entry2 in entries[i + 1:]:
+                add_duplicate(entry1, entry2, 1.0)
+
+    # Lowest threshold any pair can need; higher one for cross-year duplicates
+    min_threshold = min(threshold, 0.95)
+
+    # Use LSH to find candidate pairs of distinct titles, then confirm with fuzzy_similarity
+    signatures = [entries[0][3] for entries in clusters]
+    matcher_for = None
+    for a, b in lsh_candidate_pairs(signatures):
+        t1 = clusters[a][0][2]
+        t2 = clusters[b][0][2]
+
+        # The ratio can never exceed 2 * min(len) / (len1 + len2), so skip
+        # pairs whose lengths alone rule out a match
+        lo, hi = sorted((len(t1), len(t2)))
+        if 2 * lo < min_threshold * (lo + hi):
+            continue
+
+        # Consecutive pairs share t2, so keep one matcher for it
+        if matcher_for != b:
+            matcher_for = b
+            similarity_to_t2 = fuzzy_matcher(t2)
+
+        similarity = similarity_to_t2(t1, cutoff=min_threshold)
+        if similarity < min_threshold:
+            continue
+
+        for entry1 in clusters[a]:
+            for entry2 in clusters[b]:
+                same_year = entry1[1]['year'] == entry2[1]['year']
+                if similarity >= (threshold if same_year else 0.95):
+                    add_duplicate(entry1, entry2, similarity)
+
+    return duplicates
+
+
+def check_duplicates(papers, threshold=0.85, use_cache=True):
     """Check for potential duplicate entries using fuzzy matching."""
     print("\n" + "=" * 60)
     print(f"CHECKING FOR DUPLICATES (threshold: {threshold})")
     print("=" * 60)
 
-    # Group papers by year and venue for more efficient comparison
+    title_index = build_title_index(papers, use_cache=use_cache)
+
+    # Group papers by venue with their normalized titles and signatures; only
+    # titles within the same venue are compared
     grouped = {}
     for i, p in enumerate(papers):
-        key = (p['year'], p['venue'])
-        if key not in grouped:
-            grouped[key] = []
-        grouped[key].append((i, p))
-
-    duplicates = []
+        if p['venue'] not in grouped:
+            grouped[p['venue']] = []
+        norm, sig = title_index[i]
+        grouped[p['venue']].append((i, p, norm, sig))
 
-    # Check within same year and venue
-    for (year, venue), group in grouped.items():
-        for i, (idx1, p1) in enumerate(group):
-            for idx2, p2 in group[i + 1:]:
-                t1 = normalize_title(p1['title'])
-                t2 = normalize_title(p2['title'])
-                similarity = fuzzy_similarity(t1, t2)
-
-                if similarity >= threshold:
-                    duplicates.append({
-                        'similarity': similarity,
-                        'paper1': p1,
-                        'paper2': p2,
-                        'idx1': idx1,
-                        'idx2': idx2
-                    })
-
-    # Also check across years (same venue) for very high similarity
-    for venue in set(p['venue'] for p in papers):
-        venue_papers = [(i, p) for i, p in enumerate(papers) if p['venue'] == venue]
-        for i, (idx1, p1) in enumerate(venue_papers):
-            for idx2, p2 in venue_papers[i + 1:]:
-                if p1['year'] == p2['year']:
-                    continue  # Already checked above
-
-                t1 = normalize_title(p1['title'])
-                t2 = normalize_title(p2['title'])
-                similarity = fuzzy_similarity(t1, t2)
-
-                # Higher threshold for cross-year duplicates
-                if similarity >= 0.95:
-                    duplicates.append({
-                        'similarity': similarity,
-                        'paper1': p1,
-                        'paper2': p2,
-                        'idx1': idx1,
-                        'idx2': idx2
-                    })
+    # Venues share nothing, so scan them concurrently
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(partial(scan_venue_duplicates, threshold=threshold), grouped.values())
+        duplicates = [dup for venue_dups in results for dup in venue_dups]
 
     # Sort by similarity descending
     duplicates.sort(key=lambda x: -x['similarity'])
 
     if duplicates:
         print(f"\nFound {len(duplicates)} potential duplicate(s):\n")
+        # Build the report in memory and write it at once
+        buf = io.StringIO()
         for dup in duplicates:
-            print(f"Similarity: {dup['similarity']:.2%}")
-            print(f"  Paper 1 [{dup['idx1']}]: {dup['paper1']['title'][:60]}...")
-            print(f"           ({dup['paper1']['venue']} {dup['paper1']['year']})")
-            print(f"  Paper 2 [{dup['idx2']}]: {dup['paper2']['title'][:60]}...")
-            print(f"           ({dup['paper2']['venue']} {dup['paper2']['year']})")
-            print()
+            buf.write(f"Similarity: {dup['similarity']:.2%}\n")
+            buf.write(f"  Paper 1 [{dup['idx1']}]: {dup['paper1']['title'][:60]}...\n")
+            buf.write(f"           ({dup['paper1']['venue']} {dup['paper1']['year']})\n")
+            buf.write(f"  Paper 2 [{dup['idx2']}]: {dup['paper2']['title'][:60]}...\n")
+            buf.write(f"           ({dup['paper2']['venue']} {dup['paper2']['year']})\n")
+            buf.write("\n")
+        sys.stdout.write(buf.getvalue())
         return True
     else:
         print("\nNo potential duplicates found.")
         return False
 
 
-def query_dblp(title, max_results=5, use_cache=True):
-    """Query DBLP API for a paper title."""
-    base_url = "https://dblp.org/search/publ/api"
-    params = {
-        'q': title,
-        'format': 'json',
-        'h': max_results
-    }
-    url = f"{base_url}?{urllib.parse.urlencode(params)}"
+def make_rate_limiter(delay, jitter=0.1):
+    """Build a thread-safe function that spaces out calls by about delay seconds.
+
+    Each call reserves the next free slot (with +-jitter to avoid lockstep
+    bursts) and sleeps until it is reached.
+    """
+    lock = threading.Lock()
+    next_slot = [0.0]
+
+    def wait():
+        with lock:
+            now = time.monotonic()
+            start = max(now, next_slot[0])
+            next_slot[0] = start + delay * random.uniform(1 - jitter, 1 + jitter)
+        if start > now:
+            time.sleep(start - now)
+
+    return wait
+
+
+def fetch_dblp(title, max_results=5, use_cache=True, throttle=None):
+    """Query DBLP API for a paper title, reporting whether the cache answered.
+
+    Returns (hits, was_cached); hits is None on API errors. throttle, if
+    given, is called before any network request (not on cache hits).
+    """
+    url = get_dblp_query_url(title, max_results)
 
     # Check cache first
     if use_cache:
         cached = load_from_cache(url)
         if cached is not None:
-            return cached
+            return cached, True
+
+    if throttle:
+        throttle()
 
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'BestPapersChecker/1.0'})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            result = data.get('result', {}).get('hits', {}).get('hit', [])
+        data = loads_json(http_get(url, {'User-Agent': 'BestPapersChecker/1.0'}, timeout=10))
+        result = data.get('result', {}).get('hits', {}).get('hit', [])
 
-            # Cache the result
-            if use_cache:
-                save_to_cache(url, result)
+        # Store normalized hit titles so matching never recomputes them
+        for hit in result:
+            hit[DBLP_NORM_TITLE_KEY] = normalize_dblp_title(hit)
 
-            return result
+        # Cache the result
+        if use_cache:
+            save_to_cache(url, result)
+
+        return result, False
     except Exception as e:
-        return None
+        return None, False
+
+
+def query_dblp(title, max_results=5, use_cache=True, throttle=None):
+    """Query DBLP API for a paper title."""
+    return fetch_dblp(title, max_results, use_cache=use_cache, throttle=throttle)[0]
 
 
 def extract_dblp_authors(info):
@@ -604,8 +900,8 @@ def query_arxiv(title, max_results=3, use_cache=True):
 
     base_url = "http://export.arxiv.org/api/query"
     # Clean title for search
-    clean_title = re.sub(r'[^\w\s]', ' ', title)
-    clean_title = re.sub(r'\s+', ' ', clean_title).strip()
+    clean_title = _PUNCT_RE.sub(' ', title)
+    clean_title = _WS_RE.sub(' ', clean_title).strip()
     params = {
         'search_query': f'ti:"{clean_title}"',
         'start': 0,
@@ -620,33 +916,158 @@ def query_arxiv(title, max_results=3, use_cache=True):
             return cached
 
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'BestPapersChecker/1.0'})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = response.read().decode('utf-8')
-            root = ET.fromstring(data)
-
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-            entries = root.findall('atom:entry', ns)
-
-            results = []
-            for entry in entries:
-                entry_title = entry.find('atom:title', ns)
-                entry_id = entry.find('atom:id', ns)
-                if entry_title is not None and entry_id is not None:
-                    results.append({
-                        'title': entry_title.text.strip().replace('\n', ' '),
-                        'url': entry_id.text.strip()
-                    })
+        data = http_get(url, {'User-Agent': 'BestPapersChecker/1.0'}, timeout=10).decode('utf-8')
+        root = ET.fromstring(data)
+
+        ns = {'atom': 'http://www.w3.org/2005/Atom'}
+        entries = root.findall('atom:entry', ns)
+
+        results = []
+        for entry in entries:
+            entry_title = entry.find('atom:title', ns)
+            entry_id = entry.find('atom:id', ns)
+            if entry_title is not None and entry_id is not None:
+                results.append({
+                    'title': entry_title.text.strip().replace('\n', ' '),
+                    'url': entry_id.text.strip()
+                })
 
-            # Cache the result
-            if use_cache:
-                save_to_cache(url, results)
+        # Cache the result
+        if use_cache:
+            save_to_cache(url, results)
 
-            return results
+        return results
     except Exception as e:
         return None
 
 
+def normalize_dblp_title(hit):
+    """Normalize the title of a DBLP search hit (DBLP titles end with a period)."""
+    return normalize_title(hit.get('info', {}).get('title', '').rstrip('.'))
+
+
+def find_best_dblp_match(title, results):
+    """Find the DBLP hit whose title best matches the given title.
+
+    Returns (info, similarity), or (None, 0) if no hit has any similarity.
+    """
+    norm_title = normalize_title(title)
+    # Hits cached before the last normalize_title change lack a current precomputed title
+    hit_titles = [hit.get(DBLP_NORM_TITLE_KEY) or normalize_dblp_title(hit) for hit in results]
+
+    if process is not None:
+        match = process.extractOne(norm_title, hit_titles, scorer=fuzz.ratio)
+        if not match or match[1] <= 0:
+            return None, 0
+        return results[match[2]].get('info', {}), match[1] / 100.0
+
+    best_match = None
+    best_similarity = 0
+    for hit, hit_title in zip(results, hit_titles):
+        # Hits that can't beat the best so far are cut off early
+        similarity = fuzzy_similarity(norm_title, hit_title, cutoff=best_similarity)
+        if similarity > best_similarity:
+            best_similarity = similarity
+            best_match = hit.get('info', {})
+            # Nothing beats an exact match, and DBLP usually ranks it first
+            if best_similarity == 1.0:
+                break
+    return best_match, best_similarity
+
+
+def get_dblp_verdict_key(paper):
+    """Get the cache key for a paper's DBLP verdict.
+
+    The key changes whenever the record, the evaluation logic or the scorer
+    backend (rapidfuzz and difflib score slightly differently) does.
+    """
+    record = {k: paper.get(k) for k in ('title', 'authors', 'url')}
+    record['_version'] = [DBLP_VERDICT_VERSION, TITLE_INDEX_VERSION, 'rapidfuzz' if fuzz is not None else 'difflib']
+    fingerprint = hashlib.blake2b(json.dumps(record, sort_keys=True).encode(), digest_size=16).hexdigest()
+    return f"dblp-verdict:{fingerprint}"
+
+
+def evaluate_dblp_results(paper, results):
+    """Compare a paper against its DBLP search hits.
+
+    Returns a JSON-serializable verdict with the status text to print, the
+    issues found (without the paper), the DBLP URL to record in
+    data_checked_via ('' if none) and whether the paper was verified or
+    not found.
+    """
+    verdict = {'status': '', 'issues': [], 'dblp_url': '', 'verified': False, 'not_found': False}
+
+    if not results:
+        verdict['status'] = "NOT FOUND\n"
+        verdict['not_found'] = True
+        verdict['issues'].append({
+            'issue': 'Not found in DBLP',
+            'dblp_data': None
+        })
+        return verdict
+
+    best_match, best_similarity = find_best_dblp_match(paper['title'], results)
+
+    dblp_authors = extract_dblp_authors(best_match) if best_match else []
+    dblp_data = {
+        'title': best_match.get('title', '').rstrip('.') if best_match else '',
+        'authors': dblp_authors,
+        'year': best_match.get('year', '') if best_match else '',
+        'venue': best_match.get('venue', '') if best_match else '',
+        'url': best_match.get('url', '') if best_match else '',
+        'ee': extract_dblp_ee(best_match) if best_match else ''
+    }
+
+    if best_similarity < 0.8:
+        verdict['status'] = f"LOW MATCH ({best_similarity:.0%})\n"
+        verdict['issues'].append({
+            'issue': f'Low title match ({best_similarity:.0%})',
+            'dblp_data': dblp_data
+        })
+        return verdict
+
+    verdict['dblp_url'] = dblp_data['url']
+
+    # Check authors
+    paper_authors = [author_name(a) for a in paper.get('authors', [])]
+
+    # Normalize author names for comparison
+    # Strip DBLP disambiguation numbers (e.g., "0002") before comparing
+    dblp_names = set(normalize_title(strip_dblp_disambiguation(a)) for a in dblp_authors)
+    paper_names = set(normalize_title(a) for a in paper_authors)
+
+    author_overlap = len(dblp_names & paper_names) / max(len(dblp_names), len(paper_names), 1)
+
+    status = []
+
+    if author_overlap < 0.5 and len(paper_authors) > 0:
+        status.append(f"AUTHOR MISMATCH ({author_overlap:.0%})")
+        verdict['issues'].append({
+            'issue': f'Author mismatch ({author_overlap:.0%} overlap)',
+            'dblp_data': dblp_data
+        })
+
+    # Check for missing URL
+    if not paper.get('url') and (dblp_data['ee'] or dblp_data['url']):
+        if status:
+            status.append(" + MISSING URL\n")
+            # Extend the author mismatch issue for this paper
+            verdict['issues'][0]['issue'] += ' + Missing URL'
+        else:
+            status.append("MISSING URL")
+            verdict['issues'].append({
+                'issue': 'Missing URL',
+                'dblp_data': dblp_data
+            })
+
+    if not status:
+        verdict['status'] = "OK\n"
+        verdict['verified'] = True
+    else:
+        verdict['status'] = ''.join(status) + "\n"  # Newline after issue status
+    return verdict
+
+
 def verify_against_dblp(papers, sample_size=None, delay=0.5, log_file=None, use_cache=True):
     """Verify papers against DBLP database and add data_checked_via URLs."""
     print("\n" + "=" * 60)
@@ -658,7 +1079,6 @@ def verify_against_dblp(papers, sample_size=None, delay=0.5, log_file=None, use_
 
     papers_to_check = papers
     if sample_size and sample_size < len(papers):
-        import random
         papers_to_check = random.sample(papers, sample_size)
         print(f"\nChecking {sample_size} random papers (use --dblp-all for full check)")
     else:
@@ -670,153 +1090,63 @@ def verify_against_dblp(papers, sample_size=None, delay=0.5, log_file=None, use_
     cache_hits = 0
     dblp_urls_added = 0
 
-    for i, paper in enumerate(papers_to_check):
-        title = paper['title']
-        print(f"  [{i+1}/{len(papers_to_check)}] {title[:50]}...", end=" ", flush=True)
-
-        # Check if cached to avoid delay
-        was_cached = use_cache and is_dblp_cached(title)
-        if was_cached:
-            cache_hits += 1
-
-        results = query_dblp(title, use_cache=use_cache)
-
-        if results is None:
-            print("ERROR (API)")
-            issues.append({
-                'paper': paper,
-                'issue': 'DBLP API error',
-                'dblp_data': None
-            })
-            if not was_cached:
-                time.sleep(delay)
-            continue
-
-        if not results:
-            print("NOT FOUND")
-            not_found += 1
-            issues.append({
-                'paper': paper,
-                'issue': 'Not found in DBLP',
-                'dblp_data': None
-            })
-            if not was_cached:
-                time.sleep(delay)
-            continue
-
-        # Find best match
-        best_match = None
-        best_similarity = 0
-
-        for hit in results:
-            info = hit.get('info', {})
-            dblp_title = info.get('title', '').rstrip('.')
-
-            similarity = fuzzy_similarity(
-                normalize_title(title),
-                normalize_title(dblp_title)
-            )
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = info
-
-        dblp_authors = extract_dblp_authors(best_match) if best_match else []
-        dblp_title = best_match.get('title', '').rstrip('.') if best_match else ''
-        dblp_year = best_match.get('year', '') if best_match else ''
-        dblp_venue = best_match.get('venue', '') if best_match else ''
-        dblp_url = best_match.get('url', '') if best_match else ''
-        dblp_ee = extract_dblp_ee(best_match) if best_match else ''
-
-        if best_similarity < 0.8:
-            print(f"LOW MATCH ({best_similarity:.0%})")
-            issues.append({
-                'paper': paper,
-                'issue': f'Low title match ({best_similarity:.0%})',
-                'dblp_data': {
-                    'title': dblp_title,
-                    'authors': dblp_authors,
-                    'year': dblp_year,
-                    'venue': dblp_venue,
-                    'url': dblp_url,
-                    'ee': dblp_ee
-                }
-            })
-        else:
-            # Add DBLP URL to paper for verification tracking
-            if dblp_url:
-                paper['data_checked_via'] = dblp_url
-                dblp_urls_added += 1
-            # Check authors
-            paper_authors = [a.get('name', '') for a in paper.get('authors', [])]
+    # Papers whose record hasn't changed since a previous run reuse that run's verdict
+    verdicts = [
+        load_from_cache(get_dblp_verdict_key(p)) if use_cache else None
+        for p in papers_to_check
+    ]
 
-            # Normalize author names for comparison
-            # Strip DBLP disambiguation numbers (e.g., "0002") before comparing
-            dblp_names = set(normalize_title(strip_dblp_disambiguation(a)) for a in dblp_authors)
-            paper_names = set(normalize_title(a) for a in paper_authors)
+    # Query DBLP concurrently for the rest; the shared limiter keeps network
+    # requests `delay` seconds apart, while cache hits return immediately
+    throttle = make_rate_limiter(delay)
 
-            author_overlap = len(dblp_names & paper_names) / max(len(dblp_names), len(paper_names), 1)
+    executor = ThreadPoolExecutor(max_workers=DBLP_WORKERS)
+    futures = [
+        executor.submit(fetch_dblp, p['title'], use_cache=use_cache, throttle=throttle)
+        if verdict is None else None
+        for p, verdict in zip(papers_to_check, verdicts)
+    ]
 
-            has_issue = False
+    try:
+        for i, (paper, verdict, future) in enumerate(zip(papers_to_check, verdicts, futures)):
+            title = paper['title']
+            print(f"  [{i+1}/{len(papers_to_check)}] {title[:50]}...", end=" ", flush=True)
 
-            if author_overlap < 0.5 and len(paper_authors) > 0:
-                print(f"AUTHOR MISMATCH ({author_overlap:.0%})", end="")
-                has_issue = True
-                issues.append({
-                    'paper': paper,
-                    'issue': f'Author mismatch ({author_overlap:.0%} overlap)',
-                    'dblp_data': {
-                        'title': dblp_title,
-                        'authors': dblp_authors,
-                        'year': dblp_year,
-                        'venue': dblp_venue,
-                        'url': dblp_url,
-                        'ee': dblp_ee
-                    }
-                })
+            if verdict is not None:
+                cache_hits += 1
+            else:
+                # Results are consumed in input order, so output stays ordered
+                results, was_cached = future.result()
+                if was_cached:
+                    cache_hits += 1
 
-            # Check for missing URL
-            if not paper.get('url') and (dblp_ee or dblp_url):
-                found_url = dblp_ee or dblp_url
-                if has_issue:
-                    print(f" + MISSING URL")
-                else:
-                    print(f"MISSING URL", end="")
-                    has_issue = True
-
-                # Check if we already added an issue for this paper
-                existing_issue = None
-                for iss in issues:
-                    if iss['paper'] is paper:
-                        existing_issue = iss
-                        break
-
-                if existing_issue:
-                    existing_issue['issue'] += ' + Missing URL'
-                    existing_issue['dblp_data']['ee'] = dblp_ee
-                else:
+                if results is None:
+                    print("ERROR (API)")
                     issues.append({
                         'paper': paper,
-                        'issue': 'Missing URL',
-                        'dblp_data': {
-                            'title': dblp_title,
-                            'authors': dblp_authors,
-                            'year': dblp_year,
-                            'venue': dblp_venue,
-                            'url': dblp_url,
-                            'ee': dblp_ee
-                        }
+                        'issue': 'DBLP API error',
+                        'dblp_data': None
                     })
+                    continue
 
-            if not has_issue:
-                print("OK")
+                verdict = evaluate_dblp_results(paper, results)
+                # Only verdicts on freshly fetched hits are cached, so a verdict
+                # never outlives the DBLP response it was based on
+                if use_cache and not was_cached:
+                    save_to_cache(get_dblp_verdict_key(paper), verdict)
+
+            sys.stdout.write(verdict['status'])
+            issues.extend({'paper': paper, **issue} for issue in verdict['issues'])
+            if verdict['dblp_url']:
+                # Add DBLP URL to paper for verification tracking
+                paper['data_checked_via'] = verdict['dblp_url']
+                dblp_urls_added += 1
+            if verdict['verified']:
                 verified += 1
-            else:
-                print()  # Newline after issue status
-
-        # Only rate limit for non-cached requests
-        if not was_cached:
-            time.sleep(delay)
+            if verdict['not_found']:
+                not_found += 1
+    finally:
+        executor.shutdown(cancel_futures=True)
 
     # Report results
     print(f"\n\nDBLP Verification Results:")
@@ -835,7 +1165,7 @@ def verify_against_dblp(papers, sample_size=None, delay=0.5, log_file=None, use_
         for idx, issue in enumerate(issues, 1):
             p = issue['paper']
             dblp = issue['dblp_data']
-            paper_authors = [a.get('name', '') for a in p.get('authors', [])]
+            paper_authors = [author_name(a) for a in p.get('authors', [])]
 
             print(f"\n{'─' * 60}")
             print(f"Issue #{idx}: {issue['issue']}")
@@ -864,51 +1194,55 @@ def verify_against_dblp(papers, sample_size=None, delay=0.5, log_file=None, use_
     # Write log file if requested
     if log_file:
         from datetime import datetime
+        # Build the log in memory and write it at once
+        buf = io.StringIO()
+        buf.write(f"DBLP Verification Log\n")
+        buf.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf.write(f"{'=' * 60}\n\n")
+        buf.write(f"Papers checked: {len(papers_to_check)}\n")
+        buf.write(f"Verified: {verified}\n")
+        buf.write(f"Not found: {not_found}\n")
+        buf.write(f"Issues: {len(issues) - not_found}\n\n")
+
+        if issues:
+            buf.write(f"{'=' * 60}\n")
+            buf.write(f"DETAILED ISSUES\n")
+            buf.write(f"{'=' * 60}\n\n")
+
+            for idx, issue in enumerate(issues, 1):
+                p = issue['paper']
+                dblp = issue['dblp_data']
+                paper_authors = [author_name(a) for a in p.get('authors', [])]
+
+                buf.write(f"{'─' * 60}\n")
+                buf.write(f"Issue #{idx}: {issue['issue']}\n")
+                buf.write(f"{'─' * 60}\n\n")
+
+                buf.write(f"DATABASE ENTRY (incorrect):\n")
+                buf.write(f"  Title:   {p['title']}\n")
+                buf.write(f"  Authors: {', '.join(paper_authors) if paper_authors else '(none)'}\n")
+                buf.write(f"  Venue:   {p['venue']} {p['year']}\n")
+                buf.write(f"  URL:     {p.get('url') or '(none)'}\n\n")
+
+                if dblp:
+                    buf.write(f"DBLP DATA (correct):\n")
+                    buf.write(f"  Title:   {dblp['title']}\n")
+                    buf.write(f"  Authors: {', '.join(dblp['authors']) if dblp['authors'] else '(none)'}\n")
+                    buf.write(f"  Year:    {dblp['year']}\n")
+                    buf.write(f"  Venue:   {dblp['venue']}\n")
+                    buf.write(f"  DBLP:    {dblp['url'] or '(none)'}\n")
+                    if dblp.get('ee'):
+                        buf.write(f"  Paper:   {dblp['ee']}\n")
+                else:
+                    buf.write(f"DBLP DATA: Not available\n")
+
+                buf.write(f"\n")
+
+        buf.write(f"{'─' * 60}\n")
+        buf.write(f"End of log\n")
+
         with open(log_file, 'w', encoding='utf-8') as f:
-            f.write(f"DBLP Verification Log\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"{'=' * 60}\n\n")
-            f.write(f"Papers checked: {len(papers_to_check)}\n")
-            f.write(f"Verified: {verified}\n")
-            f.write(f"Not found: {not_found}\n")
-            f.write(f"Issues: {len(issues) - not_found}\n\n")
-
-            if issues:
-                f.write(f"{'=' * 60}\n")
-                f.write(f"DETAILED ISSUES\n")
-                f.write(f"{'=' * 60}\n\n")
-
-                for idx, issue in enumerate(issues, 1):
-                    p = issue['paper']
-                    dblp = issue['dblp_data']
-                    paper_authors = [a.get('name', '') for a in p.get('authors', [])]
-
-                    f.write(f"{'─' * 60}\n")
-                    f.write(f"Issue #{idx}: {issue['issue']}\n")
-                    f.write(f"{'─' * 60}\n\n")
-
-                    f.write(f"DATABASE ENTRY (incorrect):\n")
-                    f.write(f"  Title:   {p['title']}\n")
-                    f.write(f"  Authors: {', '.join(paper_authors) if paper_authors else '(none)'}\n")
-                    f.write(f"  Venue:   {p['venue']} {p['year']}\n")
-                    f.write(f"  URL:     {p.get('url') or '(none)'}\n\n")
-
-                    if dblp:
-                        f.write(f"DBLP DATA (correct):\n")
-                        f.write(f"  Title:   {dblp['title']}\n")
-                        f.write(f"  Authors: {', '.join(dblp['authors']) if dblp['authors'] else '(none)'}\n")
-                        f.write(f"  Year:    {dblp['year']}\n")
-                        f.write(f"  Venue:   {dblp['venue']}\n")
-                        f.write(f"  DBLP:    {dblp['url'] or '(none)'}\n")
-                        if dblp.get('ee'):
-                            f.write(f"  Paper:   {dblp['ee']}\n")
-                    else:
-                        f.write(f"DBLP DATA: Not available\n")
-
-                    f.write(f"\n")
-
-            f.write(f"{'─' * 60}\n")
-            f.write(f"End of log\n")
+            f.write(buf.getvalue())
 
         print(f"\nLog written to: {log_file}")
 
@@ -950,7 +1284,6 @@ def verify_pdf_titles(papers, sample_size=None, delay=1.0, use_cache=True):
 
     papers_to_check = accessible_papers
     if sample_size and sample_size < len(accessible_papers):
-        import random
         papers_to_check = random.sample(accessible_papers, sample_size)
         print(f"Checking {sample_size} random papers (use --pdf-all for full check)")
     else:
@@ -1084,28 +1417,29 @@ def check_data_quality(papers):
     issues = []
 
     for i, p in enumerate(papers):
+        # Look each field up once
+        title = p.get('title')
+        short_title = (title or '')[:50]
+        year = p.get('year')
+
         # Check for missing title
-        if not p.get('title') or len(p['title'].strip()) < 5:
+        if not title or len(title.strip()) < 5:
             issues.append(f"[{i}] Missing or very short title: {p.get('title', 'N/A')}")
 
         # Check for missing authors (now an array)
-        authors = p.get('authors', [])
-        if not authors or not isinstance(authors, list) or len(authors) == 0:
-            issues.append(f"[{i}] Missing authors: {p['title'][:50]}...")
+        authors = p.get('authors')
+        if not authors or not isinstance(authors, list):
+            issues.append(f"[{i}] Missing authors: {short_title}...")
 
-        # Check for missing URL (warning only)
-        if not p.get('url'):
-            # Don't report as issue, just info
-            pass
+        # Missing URLs are not reported as issues (see the summary instead)
 
         # Check for suspicious year
-        if p.get('year') and (p['year'] < 2000 or p['year'] > 2030):
-            issues.append(f"[{i}] Suspicious year {p['year']}: {p['title'][:50]}...")
+        if year and (year < 2000 or year > 2030):
+            issues.append(f"[{i}] Suspicious year {year}: {short_title}...")
 
     if issues:
         print(f"\nFound {len(issues)} issue(s):\n")
-        for issue in issues:
-            print(f"  - {issue}")
+        sys.stdout.write(''.join(f"  - {issue}\n" for issue in issues))
         return True
     else:
         print("\nNo data quality issues found.")
@@ -1120,40 +1454,41 @@ def print_summary(papers):
 
     print(f"\nTotal papers: {len(papers)}")
 
-    # By venue
-    venues = {}
+    # Tally venues, years, URLs and authors in a single pass
+    venues = Counter()
+    years = Counter()
+    author_counts = Counter()
+    with_url = 0
     for p in papers:
-        venues[p['venue']] = venues.get(p['venue'], 0) + 1
-    print("\nBy venue:")
+        venues[p['venue']] += 1
+        years[p['year']] += 1
+        if p.get('url'):
+            with_url += 1
+        authors = p.get('authors', [])
+        if isinstance(authors, list):
+            author_counts.update(name for name in map(author_name, authors) if name)
+
+    # Build the report in memory and write it at once
+    buf = io.StringIO()
+
+    buf.write("\nBy venue:\n")
     for venue, count in sorted(venues.items()):
-        print(f"  {venue}: {count}")
+        buf.write(f"  {venue}: {count}\n")
 
-    # By year
-    years = {}
-    for p in papers:
-        years[p['year']] = years.get(p['year'], 0) + 1
-    print("\nBy year:")
+    buf.write("\nBy year:\n")
     for year in sorted(years.keys(), reverse=True):
-        print(f"  {year}: {years[year]}")
+        buf.write(f"  {year}: {years[year]}\n")
 
     # Papers with URLs
-    with_url = sum(1 for p in papers if p.get('url'))
-    print(f"\nPapers with URLs: {with_url}/{len(papers)} ({100*with_url/len(papers):.1f}%)")
+    buf.write(f"\nPapers with URLs: {with_url}/{len(papers)} ({100*with_url/len(papers):.1f}%)\n")
 
     # Top authors
-    author_counts = {}
-    for p in papers:
-        authors = p.get('authors', [])
-        if isinstance(authors, list):
-            for a in authors:
-                name = a.get('name', '') if isinstance(a, dict) else str(a)
-                if name:
-                    author_counts[name] = author_counts.get(name, 0) + 1
-
-    top_authors = sorted(author_counts.items(), key=lambda x: -x[1])[:25]
-    print("\nTop 25 authors:")
+    top_authors = author_counts.most_common(25)
+    buf.write("\nTop 25 authors:\n")
     for i, (name, count) in enumerate(top_authors, 1):
-        print(f"  {i}. {name}: {count} papers")
+        buf.write(f"  {i}. {name}: {count} papers\n")
+
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
@@ -1186,19 +1521,24 @@ def main():
     print("Distinguished Papers Database Checker")
     print("=" * 60)
 
-    data = load_data()
-    papers = data['papers']
+    # Only DBLP verification writes the data back; other runs can stream it read-only
+    if args.dblp_all or args.dblp_sample or args.dblp:
+        data = load_data()
+        papers = data['papers']
+    else:
+        papers = load_papers()
     print(f"Loaded {len(papers)} papers from database.")
 
+    use_cache = not args.no_cache
+
     # Run checks
     has_missing_years = check_missing_years(papers)
-    has_duplicates = check_duplicates(papers)
+    has_duplicates = check_duplicates(papers, use_cache=use_cache)
     has_quality_issues = check_data_quality(papers)
 
     # DBLP verification (optional)
     has_dblp_issues = False
     log_file = args.log
-    use_cache = not args.no_cache
     if args.dblp_all:
         has_dblp_issues = verify_against_dblp(papers, log_file=log_file, use_cache=use_cache)
         save_data(data)